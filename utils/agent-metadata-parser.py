@@ -10,6 +10,40 @@ import jsonschema
 import os
 import sys
 import fnmatch
+import functools
+
+# Prefer the libyaml C loader (5-10x faster), fall back to pure Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Default restriction constants, assembled once at module load.
+# Kept as tuples (copied into lists per call) so the restriction dicts
+# stay JSON-serializable for the CLI output.
+_DEFAULT_FORBIDDEN_PATHS = tuple(map(os.path.expanduser, (
+    "~/.ssh",
+    "~/.ssh/*",
+    "~/.aws",
+    "~/.aws/*",
+    "~/.env*",
+    ".env",
+    ".env.*",
+    "credentials.json",
+    "secrets.*"
+)))
+_HIGH_SEC_ALLOWED_TOOLS = ("Read", "Grep", "Glob")
+_HIGH_SEC_FORBIDDEN_TOOLS = ("Write", "Edit", "Bash")
+
+# Optional: compile the fused glob patterns with google-re2 (linear-time
+# DFA, no backtracking on pathological globs). Opt-in via env var so the
+# stdlib engine remains the default.
+_glob_re = re
+if os.environ.get('CLAUDE_AGENT_PARSER_RE2'):
+    try:
+        import re2 as _glob_re
+    except ImportError:
+        pass
 
 def parse_agent_metadata(agent_file_path):
     """Parse frontmatter from .agent.md file."""
@@ -21,22 +55,39 @@ def parse_agent_metadata(agent_file_path):
         return None
     
     frontmatter = match.group(1)
-    metadata = yaml.safe_load(frontmatter)
+    metadata = yaml.load(frontmatter, Loader=_YamlLoader)
     return metadata
 
+# Compiled schema validators keyed by (path, mtime) so repeated invocations
+# skip the schema file read and the meta-schema check
+_SCHEMA_CACHE = {}
+
+def _get_schema_validator(schema_path):
+    """Load and compile the JSON Schema validator, cached by path + mtime."""
+    cache_key = (schema_path, os.stat(schema_path).st_mtime_ns)
+    validator = _SCHEMA_CACHE.get(cache_key)
+    if validator is None:
+        with open(schema_path, 'r') as f:
+            schema = json.load(f)
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        validator = cls(schema)
+        _SCHEMA_CACHE.clear()  # Drop stale entries for this path
+        _SCHEMA_CACHE[cache_key] = validator
+    return validator
+
 def validate_agent_metadata(metadata):
     """Validate metadata against schema."""
     schema_path = os.path.expanduser('~/.claude/schemas/agent-metadata.schema.json')
-    with open(schema_path, 'r') as f:
-        schema = json.load(f)
-    
+    validator = _get_schema_validator(schema_path)
+
     try:
-        jsonschema.validate(metadata, schema)
+        validator.validate(metadata)
         return (True, None)
     except jsonschema.ValidationError as e:
         return (False, e.message)
 
-def get_tool_restrictions(metadata):
+def _get_tool_restrictions(metadata):
     """Generate tool restriction list."""
     restrictions = {
         "allowed": [],
@@ -54,8 +105,8 @@ def get_tool_restrictions(metadata):
             restrictions["mode"] = "blacklist"
     
     if metadata.get('security_level') == 'high':
-        restrictions["allowed"] = ["Read", "Grep", "Glob"]
-        restrictions["forbidden"] = ["Write", "Edit", "Bash"]
+        restrictions["allowed"] = list(_HIGH_SEC_ALLOWED_TOOLS)
+        restrictions["forbidden"] = list(_HIGH_SEC_FORBIDDEN_TOOLS)
         restrictions["mode"] = "whitelist"
     
     if metadata.get('readonly', False):
@@ -68,33 +119,80 @@ def get_tool_restrictions(metadata):
     
     return restrictions
 
-def get_path_restrictions(metadata):
-    """Generate path restriction rules."""
+def _get_path_restrictions(metadata):
+    """Generate path restriction rules.
+
+    Patterns are expanded with expanduser here, once at construction,
+    so path checks compare against pre-expanded patterns.
+    """
     restrictions = {
-        "forbidden": [
-            "~/.ssh",
-            "~/.ssh/*",
-            "~/.aws",
-            "~/.aws/*",
-            "~/.env*",
-            ".env",
-            ".env.*",
-            "credentials.json",
-            "secrets.*"
-        ],
+        "forbidden": list(_DEFAULT_FORBIDDEN_PATHS),
         "allowed": [],
         "mode": "blacklist"
     }
-    
+
     if 'forbidden_paths' in metadata:
-        restrictions["forbidden"].extend(metadata['forbidden_paths'])
-    
+        restrictions["forbidden"].extend(
+            os.path.expanduser(p) for p in metadata['forbidden_paths'])
+
     if 'allowed_paths' in metadata:
-        restrictions["allowed"] = metadata['allowed_paths']
+        restrictions["allowed"] = [
+            os.path.expanduser(p) for p in metadata['allowed_paths']]
         restrictions["mode"] = "whitelist"
-    
+
     return restrictions
 
+def _restrictions_key(metadata):
+    """Build a hashable key from the restriction-relevant metadata fields.
+
+    None marks an absent field (presence changes the mode, so absent and
+    empty must not collide).
+    """
+    def opt(field):
+        return tuple(metadata[field]) if field in metadata else None
+
+    return (opt('tools'), opt('forbidden_tools'),
+            metadata.get('security_level'), bool(metadata.get('readonly', False)),
+            opt('forbidden_paths'), opt('allowed_paths'))
+
+@functools.lru_cache(maxsize=256)
+def _build_restrictions(tools, forbidden_tools, security_level, readonly,
+                        forbidden_paths, allowed_paths):
+    """Build both restriction dicts for one metadata key.
+
+    Agents across a project typically share identical restriction sets,
+    so batch runs reuse one build (and its compiled patterns) per
+    distinct set. Callers must treat the returned dicts as read-only.
+    """
+    metadata = {'readonly': readonly}
+    if tools is not None:
+        metadata['tools'] = list(tools)
+    if forbidden_tools is not None:
+        metadata['forbidden_tools'] = list(forbidden_tools)
+    if security_level is not None:
+        metadata['security_level'] = security_level
+    if forbidden_paths is not None:
+        metadata['forbidden_paths'] = list(forbidden_paths)
+    if allowed_paths is not None:
+        metadata['allowed_paths'] = list(allowed_paths)
+
+    tool_restrictions = _get_tool_restrictions(metadata)
+    path_restrictions = _get_path_restrictions(metadata)
+
+    # Pre-warm the fused pattern cache for this restriction set
+    _compile_patterns(tuple(path_restrictions["forbidden"]))
+    _compile_patterns(tuple(path_restrictions["allowed"]))
+
+    return tool_restrictions, path_restrictions
+
+def get_tool_restrictions(metadata):
+    """Generate tool restriction list (memoized per restriction set)."""
+    return _build_restrictions(*_restrictions_key(metadata))[0]
+
+def get_path_restrictions(metadata):
+    """Generate path restriction rules (memoized per restriction set)."""
+    return _build_restrictions(*_restrictions_key(metadata))[1]
+
 def is_tool_allowed(tool_name, restrictions):
     """Check if tool is allowed."""
     mode = restrictions["mode"]
@@ -106,22 +204,60 @@ def is_tool_allowed(tool_name, restrictions):
     else:
         return True
 
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(patterns):
+    """Split a pattern set into prefix checks plus one compiled glob regex.
+
+    Returns (glob_re, prefixes). Literal patterns (no *?[) are fully
+    covered by the startswith prefix check, so only real globs are fused
+    into a compiled regex; fnmatch would re-translate and re-compile each
+    pattern on every call. Patterns are already expanded by
+    get_path_restrictions.
+    """
+    globs = [p for p in patterns if any(c in p for c in '*?[')]
+    glob_re = _compile_globs(globs) if globs else None
+    # startswith applies to every pattern (original fnmatch-or-prefix rule)
+    return glob_re, patterns
+
+def _compile_globs(globs):
+    """Fuse translated glob patterns into one compiled regex.
+
+    fnmatch.translate ends each pattern with Python's \\Z anchor, which
+    RE2 rejects (it spells the anchor \\z), so the re2 path rewrites the
+    anchor per pattern and falls back to the stdlib engine if RE2 still
+    refuses the fused pattern.
+    """
+    if _glob_re is re:
+        return re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in globs))
+
+    translated = []
+    for p in globs:
+        t = fnmatch.translate(p)
+        if t.endswith('\\Z'):
+            t = t[:-1] + 'z'
+        translated.append(f'(?:{t})')
+    try:
+        return _glob_re.compile('|'.join(translated))
+    except _glob_re.error:
+        return re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in globs))
+
+def _matches_any(file_path, patterns):
+    """Check file_path against a pattern set (glob or prefix match)."""
+    glob_re, prefixes = _compile_patterns(tuple(patterns))
+    if prefixes and file_path.startswith(prefixes):
+        return True
+    return glob_re is not None and bool(glob_re.match(file_path))
+
 def is_path_allowed(file_path, restrictions):
     """Check if path is allowed."""
     file_path = os.path.expanduser(file_path)
-    
-    for pattern in restrictions["forbidden"]:
-        pattern = os.path.expanduser(pattern)
-        if fnmatch.fnmatch(file_path, pattern) or file_path.startswith(pattern):
-            return False
-    
-    if restrictions["mode"] == "whitelist":
-        for pattern in restrictions["allowed"]:
-            pattern = os.path.expanduser(pattern)
-            if fnmatch.fnmatch(file_path, pattern) or file_path.startswith(pattern):
-                return True
+
+    if _matches_any(file_path, restrictions["forbidden"]):
         return False
-    
+
+    if restrictions["mode"] == "whitelist":
+        return _matches_any(file_path, restrictions["allowed"])
+
     return True
 
 if __name__ == "__main__":
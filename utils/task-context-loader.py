@@ -8,33 +8,66 @@ import sys
 import os
 import re
 import json
+import functools
+
+# Prefer the libyaml C loader (5-10x faster), fall back to pure Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Section headers (supports ## or ### headers)
+_HEADING_RE = re.compile(r'^##+ (.*?)\s*$', re.MULTILINE)
+
+@functools.lru_cache(maxsize=64)
+def _load_doc(file_path, mtime_ns):
+    """Read a markdown file once and index its section header spans.
+
+    Cached by (file, mtime) so tasks referencing several sections of the
+    same document trigger one read and one header scan.
+    """
+    with open(file_path, 'r') as f:
+        content = f.read()
+
+    headings = list(_HEADING_RE.finditer(content))
+    sections = []  # (title, start, end) in document order
+    for i, match in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(content)
+        sections.append((match.group(1), match.start(), end))
+
+    return content, sections
 
 def extract_doc_section(file_path, section):
     """Extract a specific section from a markdown file."""
     if not os.path.exists(file_path):
         return f"ERROR: File not found: {file_path}"
-    
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Find section header (supports ## or ### headers)
-    pattern = rf'(##+ {re.escape(section)}.*?)(?=\n##+ |\Z)'
-    match = re.search(pattern, content, re.DOTALL)
-    
-    if match:
-        return match.group(1).strip()
-    else:
-        return f"ERROR: Section '{section}' not found in {file_path}"
+
+    content, sections = _load_doc(file_path, os.stat(file_path).st_mtime_ns)
+
+    # First header whose title starts with the requested section name
+    for title, start, end in sections:
+        if title.startswith(section):
+            return content[start:end].strip()
+
+    return f"ERROR: Section '{section}' not found in {file_path}"
+
+@functools.lru_cache(maxsize=8)
+def _load_task_index(tasks_file, mtime_ns):
+    """Load tasks.yml and index tasks by id for O(1) lookup.
+
+    Cached by (file, mtime) so repeated lookups reuse one parse.
+    """
+    with open(tasks_file, 'r') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    return {t['id']: t for t in data['tasks'] if isinstance(t, dict) and 'id' in t}
 
 def get_task_context(task_id, tasks_file='tasks.yml'):
     """Get full context for a task including all document references."""
     if not os.path.exists(tasks_file):
         return {"error": f"tasks.yml not found"}
-    
-    with open(tasks_file, 'r') as f:
-        data = yaml.safe_load(f)
-    
-    task = next((t for t in data['tasks'] if t['id'] == task_id), None)
+
+    tasks_by_id = _load_task_index(tasks_file, os.stat(tasks_file).st_mtime_ns)
+    task = tasks_by_id.get(task_id)
     if not task:
         return {"error": f"Task {task_id} not found"}
     
@@ -51,10 +84,9 @@ def get_task_context(task_id, tasks_file='tasks.yml'):
                 file_path, section = doc_ref.split('#', 1)
                 content = extract_doc_section(file_path.strip(), section.strip())
             else:
-                # Whole file
+                # Whole file (served from the same mtime-keyed cache)
                 if os.path.exists(doc_ref):
-                    with open(doc_ref, 'r') as f:
-                        content = f.read()
+                    content, _ = _load_doc(doc_ref, os.stat(doc_ref).st_mtime_ns)
                 else:
                     content = f"ERROR: File not found: {doc_ref}"
             
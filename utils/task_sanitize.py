@@ -9,6 +9,13 @@ Used by /todo sync when importing tasks from tasks.yml to todo.md.
 import re
 import sys
 
+# Precompiled patterns and translate table (built once at module load)
+_CHECKBOX_RE = re.compile(r'- \[[x ]\]')
+_TASK_ID_RE = re.compile(r'#task-\d+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_DANGEROUS_CHARS = ';|&$`<>'
+_DANGEROUS_TABLE = str.maketrans('', '', _DANGEROUS_CHARS)
+
 
 def sanitize_goal(goal: str) -> str:
     """
@@ -33,21 +40,19 @@ def sanitize_goal(goal: str) -> str:
     goal = goal.replace('\n', ' ').replace('\r', ' ')
 
     # 2. Remove checkbox patterns (prevents fake task injection)
-    goal = re.sub(r'- \[[x ]\]', '', goal)
-    goal = re.sub(r'#task-\d+', '', goal)  # Remove task ID patterns
-
-    # 3. Detect dangerous characters
-    dangerous_chars = [';', '|', '&', '$', '`', '<', '>']
-    for char in dangerous_chars:
-        if char in goal:
-            # Log warning but continue (don't fail)
-            print(f"⚠️  Warning: Task goal contains potentially dangerous character: {char}",
-                  file=sys.stderr)
-            # Optionally escape or remove
-            goal = goal.replace(char, '')
+    goal = _CHECKBOX_RE.sub('', goal)
+    goal = _TASK_ID_RE.sub('', goal)  # Remove task ID patterns
+
+    # 3. Remove dangerous characters in a single translate pass
+    stripped = goal.translate(_DANGEROUS_TABLE)
+    if len(stripped) != len(goal):
+        # Log warning but continue (don't fail)
+        print(f"⚠️  Warning: Task goal contains potentially dangerous characters ({_DANGEROUS_CHARS})",
+              file=sys.stderr)
+        goal = stripped
 
     # 4. Collapse multiple spaces
-    goal = re.sub(r'\s+', ' ', goal)
+    goal = _WHITESPACE_RE.sub(' ', goal)
 
     # 5. Length limit (DoS prevention)
     MAX_LENGTH = 200
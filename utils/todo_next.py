@@ -12,36 +12,40 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 
 
-def read_todos() -> list[str]:
-    """
-    Read todo.md file.
+# First incomplete task line (bytes, todo.md is scanned in binary mode)
+_INCOMPLETE_TASK_RE = re.compile(rb'^\s*- \[ \].*$', re.MULTILINE)
 
-    Returns:
-        List of lines from todo.md
+# All task-line fields in one alternation, so parse_task_info scans the
+# line once instead of running five separate regex passes
+_TASK_FIELDS_RE = re.compile(
+    r'Priority:\s*(?P<priority>\w+)'
+    r'|Due:\s*(?P<due>\d{4}-\d{2}-\d{2})'
+    r'|Created:\s*(?P<created>\d{4}-\d{2}-\d{2})'
+    r'|#(?P<tag>[a-zA-Z0-9_-]+)'
+)
 
-    Raises:
-        FileNotFoundError: If todo.md not found
-    """
-    if not Path('todo.md').exists():
-        raise FileNotFoundError("todo.md not found")
+# Big-task tag (#task-N) detection among extracted tags
+_TASK_TAG_RE = re.compile(r'task-[a-z0-9_-]+', re.IGNORECASE)
 
-    with open('todo.md', 'r') as f:
-        return f.readlines()
 
-
-def find_next_incomplete_task(lines: list[str]) -> Optional[str]:
+def find_next_incomplete_task() -> Optional[str]:
     """
-    Find first incomplete task.
+    Find first incomplete task in todo.md.
 
-    Args:
-        lines: Lines from todo.md
+    Scans the raw bytes with a single multiline regex search, stopping at
+    the first match without building a list of all lines.
 
     Returns:
         Next incomplete task line or None if all completed
+
+    Raises:
+        FileNotFoundError: If todo.md not found
     """
-    for line in lines:
-        if line.strip().startswith('- [ ]'):
-            return line.strip()
+    data = Path('todo.md').read_bytes()
+
+    match = _INCOMPLETE_TASK_RE.search(data)
+    if match:
+        return match.group(0).decode().strip()
 
     return None
 
@@ -68,30 +72,22 @@ def parse_task_info(task_line: str) -> Dict[str, Any]:
         'is_big_task': False
     }
 
-    # Check for #task-N pattern (big task)
-    match = re.search(r'#(task-[a-z0-9_-]+)', task_line, re.IGNORECASE)
-    if match:
-        info['task_id'] = match.group(1)
-        info['is_big_task'] = True
-
-    # Extract priority
-    priority_match = re.search(r'Priority:\s*(\w+)', task_line)
-    if priority_match:
-        info['priority'] = priority_match.group(1)
-
-    # Extract due date
-    due_match = re.search(r'Due:\s*(\d{4}-\d{2}-\d{2})', task_line)
-    if due_match:
-        info['due'] = due_match.group(1)
-
-    # Extract created date
-    created_match = re.search(r'Created:\s*(\d{4}-\d{2}-\d{2})', task_line)
-    if created_match:
-        info['created'] = created_match.group(1)
-
-    # Extract all tags
-    tags = re.findall(r'#([a-zA-Z0-9_-]+)', task_line)
-    info['tags'] = tags
+    # Single pass over the line, dispatching on which alternative matched
+    for match in _TASK_FIELDS_RE.finditer(task_line):
+        field = match.lastgroup
+        value = match.group(field)
+
+        if field == 'tag':
+            info['tags'].append(value)
+            # #task-N tag marks a big task
+            if info['task_id'] is None and _TASK_TAG_RE.fullmatch(value):
+                info['task_id'] = value
+                info['is_big_task'] = True
+        elif field == 'priority':
+            if info['priority'] == 'unknown':
+                info['priority'] = value
+        elif info[field] is None:  # due / created
+            info[field] = value
 
     return info
 
@@ -101,11 +97,8 @@ def display_next_task() -> None:
     Main function: find and display next task with structured output.
     """
     try:
-        # Read todo.md
-        lines = read_todos()
-
-        # Find next incomplete task
-        next_task = find_next_incomplete_task(lines)
+        # Find next incomplete task (single scan of todo.md)
+        next_task = find_next_incomplete_task()
 
         if not next_task:
             print("All tasks completed")
@@ -15,13 +15,35 @@ from typing import List, Dict, Any, Set
 
 import yaml
 
+# Prefer the libyaml C loader (5-10x faster), fall back to pure Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Add utils directory to path
 utils_dir = Path(__file__).parent
 sys.path.insert(0, str(utils_dir))
 
-from task_sanitize import sanitize_goal
+from task_sanitize import sanitize_goal, sanitize_tags
 from todo_validation import validate_task_id, safe_error_message
 
+# Known-safe priority values; anything else falls back to shlex.quote
+_ALLOWED_PRIORITIES = frozenset(('critical', 'high', 'medium', 'low'))
+
+# Task line templates keyed by (has_due, is_completed); one format_map
+# call per line instead of conditional string concatenation
+_LINE_TEMPLATES = {
+    (False, False): "{checkbox} {goal} | Priority: {priority}"
+                    " | Created: {created} {hashtags}\n",
+    (True, False): "{checkbox} {goal} | Priority: {priority} | Due: {due}"
+                   " | Created: {created} {hashtags}\n",
+    (False, True): "{checkbox} {goal} | Priority: {priority}"
+                   " | Created: {created} | Completed: {completed} {hashtags}\n",
+    (True, True): "{checkbox} {goal} | Priority: {priority} | Due: {due}"
+                  " | Created: {created} | Completed: {completed} {hashtags}\n",
+}
+
 
 def load_tasks_from_yaml() -> List[Dict[str, Any]]:
     """
@@ -35,7 +57,7 @@ def load_tasks_from_yaml() -> List[Dict[str, Any]]:
         FileNotFoundError: If tasks.yml not found
     """
     with open('tasks.yml', 'r') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     # Validate data structure
     if not isinstance(data, dict):
@@ -48,25 +70,41 @@ def load_tasks_from_yaml() -> List[Dict[str, Any]]:
     return tasks
 
 
+# Task ID pattern for tail scanning (bytes, todo.md is read in binary mode)
+_TASK_ID_TAIL_RE = re.compile(rb'#task-(\d+)')
+
+# Tail chunk sizes: initial read, then one larger retry if no ID found
+_TAIL_CHUNK = 64 * 1024
+_TAIL_CHUNK_RETRY = 256 * 1024
+
+
 def get_max_task_id() -> int:
     """
-    Get maximum task ID from last 100 lines of todo.md.
+    Get maximum task ID from the tail of todo.md.
 
-    This is more efficient than reading all task IDs for large files.
+    Reads only the last chunk of the file instead of loading it entirely,
+    so memory stays constant regardless of history size.
     Assumes task IDs are sequential (task-1, task-2, ...).
 
     Returns:
         Maximum task ID number (e.g., 5 for task-5), or 0 if no tasks
     """
     try:
-        with open('todo.md', 'r') as f:
-            lines = f.readlines()
+        with open('todo.md', 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+
+            for chunk_size in (_TAIL_CHUNK, _TAIL_CHUNK_RETRY):
+                f.seek(max(0, size - chunk_size))
+                tail = f.read()
+
+                # Search lines in reverse (newest tasks are at bottom)
+                for line in reversed(tail.split(b'\n')):
+                    match = _TASK_ID_TAIL_RE.search(line)
+                    if match:
+                        return int(match.group(1))
 
-            # Search last 100 lines in reverse (newest tasks are at bottom)
-            for line in reversed(lines[-100:]):
-                match = re.search(r'#task-(\d+)', line)
-                if match:
-                    return int(match.group(1))
+                if size <= chunk_size:
+                    break  # Entire file already scanned
 
     except FileNotFoundError:
         # Create empty todo.md if not exists
@@ -102,72 +140,73 @@ def append_new_tasks(new_tasks: List[Dict[str, Any]]) -> int:
         Number of tasks appended
     """
     import datetime
-    from task_sanitize import sanitize_tags
 
     count = 0
     sync_date = datetime.date.today().isoformat()
 
-    with open('todo.md', 'a') as f:
-        for task in new_tasks:
-            try:
-                # Validate task ID (task-N pattern)
-                task_id = validate_task_id(task['id'])
-
-                # Sanitize goal text
-                goal = sanitize_goal(task.get('goal', ''))
-
-                # Get task status (pending or completed)
-                status = task.get('status', 'pending')
-                checkbox = '- [x]' if status == 'completed' else '- [ ]'
-
-                # Quote metadata to prevent injection
-                priority = shlex.quote(str(task.get('priority', 'medium')))
-
-                # Build task line
-                line = f"{checkbox} {goal} | Priority: {priority}"
-
-                # Add Due field if exists
-                due_date = task.get('due')
-                if due_date:
-                    # Parse ISO format to YYYY-MM-DD
-                    if isinstance(due_date, str):
-                        due_date = due_date.split('T')[0]  # Remove time part
-                    line += f" | Due: {due_date}"
-
-                # Add Created field (sync date)
-                line += f" | Created: {sync_date}"
-
-                # Add Completed field if task is completed
-                if status == 'completed':
-                    completed_at = task.get('completed_at')
-                    if completed_at:
-                        # Parse ISO format to YYYY-MM-DD
-                        completed_date = completed_at.split('T')[0]
-                    else:
-                        completed_date = sync_date
-                    line += f" | Completed: {completed_date}"
-
-                # Add tags (#task-id #type)
-                tags = [task_id]  # Always include task ID
-                task_type = task.get('type')
-                if task_type:
-                    tags.append(task_type)
-
-                # Sanitize and format tags
-                tags_str = sanitize_tags(' '.join(tags))
-                if tags_str:
-                    hashtags = ' '.join(f'#{tag}' for tag in tags_str.split())
-                    line += f" {hashtags}"
-
-                line += "\n"
-                f.write(line)
-
-                count += 1
-
-            except (KeyError, ValueError) as e:
-                # Skip invalid tasks
-                print(f"WARNING: Skipping invalid task: {safe_error_message(e, 'task validation')}", file=sys.stderr)
-                continue
+    # Collect all lines first, then write the whole payload in one call
+    lines: List[str] = []
+
+    for task in new_tasks:
+        try:
+            # Validate task ID (task-N pattern)
+            task_id = validate_task_id(task['id'])
+
+            # Sanitize goal text
+            goal = sanitize_goal(task.get('goal', ''))
+
+            # Get task status (pending or completed)
+            status = task.get('status', 'pending')
+            is_completed = status == 'completed'
+
+            # Quote metadata to prevent injection (known values skip quoting)
+            priority = str(task.get('priority', 'medium'))
+            if priority not in _ALLOWED_PRIORITIES:
+                priority = shlex.quote(priority)
+
+            # Due field (parse ISO format to YYYY-MM-DD)
+            due_date = task.get('due')
+            if due_date and isinstance(due_date, str):
+                due_date = due_date.split('T')[0]  # Remove time part
+
+            # Completed field (sync date if no completed_at timestamp)
+            completed_date = None
+            if is_completed:
+                completed_at = task.get('completed_at')
+                completed_date = completed_at.split('T')[0] if completed_at else sync_date
+
+            # Tags (#task-id #type); the validated task ID is already
+            # safe, so only the type needs sanitization
+            hashtags = f'#{task_id}'
+            task_type = task.get('type')
+            if task_type:
+                type_tags = sanitize_tags(str(task_type))
+                if type_tags:
+                    hashtags += ' ' + ' '.join(f'#{t}' for t in type_tags.split())
+
+            # One template render per line
+            template = _LINE_TEMPLATES[(bool(due_date), is_completed)]
+            lines.append(template.format_map({
+                'checkbox': '- [x]' if is_completed else '- [ ]',
+                'goal': goal,
+                'priority': priority,
+                'due': due_date,
+                'created': sync_date,
+                'completed': completed_date,
+                'hashtags': hashtags,
+            }))
+
+            count += 1
+
+        except (KeyError, ValueError) as e:
+            # Skip invalid tasks
+            print(f"WARNING: Skipping invalid task: {safe_error_message(e, 'task validation')}", file=sys.stderr)
+            continue
+
+    # Single buffered write; skip the open entirely when nothing to append
+    if lines:
+        with open('todo.md', 'a', encoding='utf-8') as f:
+            f.write(''.join(lines))
 
     return count
 
@@ -9,6 +9,19 @@ import re
 import unicodedata
 from typing import Optional
 
+# Working directory, cached at import (process-lifetime for CLI tools)
+_CWD = os.getcwd()
+
+# Precompiled patterns (module-level, compiled once)
+_HOME_PATH_RE = re.compile(r'/Users/[^/]+/|/home/[^/]+/|C:\\Users\\[^\\]+\\')
+_TAG_RE = re.compile(r'[a-zA-Z0-9_-]+')
+_TAGS_ALL_RE = re.compile(r'[a-zA-Z0-9_-]{1,32}(?:\s+[a-zA-Z0-9_-]{1,32})*')
+
+# Allowed priority values: frozenset for O(1) membership, with the
+# joined display string precomputed for error messages
+_ALLOWED_PRIORITIES = frozenset(('critical', 'high', 'medium', 'low'))
+_PRIORITY_LIST = 'critical, high, medium, low'
+
 
 def validate_path(path: str) -> str:
     """
@@ -27,9 +40,10 @@ def validate_path(path: str) -> str:
         raise ValueError("Path cannot contain ..")
 
     real_path = os.path.realpath(os.path.abspath(path))
-    cwd = os.getcwd()
 
-    if not real_path.startswith(cwd):
+    # Path-boundary check against the cached cwd; commonpath avoids the
+    # startswith false match (/foo/bar vs /foo/barbaz)
+    if os.path.commonpath((real_path, _CWD)) != _CWD:
         raise ValueError("Path outside project")
 
     if '/.git/' in real_path or real_path.endswith('/.git'):
@@ -53,11 +67,17 @@ def sanitize_input(text: str, max_bytes: int = 4096, max_chars: int = 1000) -> s
     Raises:
         ValueError: If input exceeds limits
     """
-    # Unicode normalization (NFKC)
-    normalized = unicodedata.normalize('NFKC', text)
+    # Unicode normalization (NFKC); ASCII input is already normalized,
+    # and its UTF-8 byte length equals its character count
+    if text.isascii():
+        normalized = text
+        byte_length = len(text)
+    else:
+        normalized = unicodedata.normalize('NFKC', text)
+        byte_length = len(normalized.encode('utf-8'))
 
     # Check byte size
-    if len(normalized.encode('utf-8')) > max_bytes:
+    if byte_length > max_bytes:
         raise ValueError(f"Input exceeds {max_bytes} byte limit")
 
     # Check character count
@@ -80,7 +100,9 @@ def validate_task_id(task_id: str) -> str:
     Raises:
         ValueError: If task ID is invalid
     """
-    if not re.match(r'^task-\d+$', task_id):
+    # Trivial pattern (task-N): startswith + isdigit are C-level and
+    # beat a regex engine invocation for this shape
+    if not (task_id.startswith('task-') and task_id[5:].isdigit()):
         raise ValueError(f"Invalid task ID format: {task_id} (expected: task-N)")
 
     return task_id
@@ -100,11 +122,11 @@ def safe_error_message(error: Exception, context: str) -> str:
     # Get error message
     msg = str(error)
 
-    # Remove absolute paths
-    msg = msg.replace(os.getcwd(), '<project>')
-    msg = re.sub(r'/Users/[^/]+/', '<home>/', msg)
-    msg = re.sub(r'/home/[^/]+/', '<home>/', msg)
-    msg = re.sub(r'C:\\Users\\[^\\]+\\', '<home>\\', msg)
+    # Remove absolute paths (one fused pass for all home-dir forms;
+    # the lambda replacement also avoids template escape handling)
+    msg = msg.replace(_CWD, '<project>')
+    msg = _HOME_PATH_RE.sub(
+        lambda m: '<home>\\' if m.group(0).startswith('C:') else '<home>/', msg)
 
     # Remove stack traces (keep first line only)
     msg = msg.split('\n')[0]
@@ -125,12 +147,10 @@ def validate_priority(priority: str) -> str:
     Raises:
         ValueError: If priority is invalid
     """
-    allowed_priorities = ['critical', 'high', 'medium', 'low']
-
-    if priority not in allowed_priorities:
+    if priority not in _ALLOWED_PRIORITIES:
         raise ValueError(
             f"Invalid priority: {priority} "
-            f"(allowed: {', '.join(allowed_priorities)})"
+            f"(allowed: {_PRIORITY_LIST})"
         )
 
     return priority
@@ -152,11 +172,16 @@ def validate_tags(tags: str) -> str:
     if not tags:
         return ""
 
+    # Fast path: accept the whole string with one scan
+    if _TAGS_ALL_RE.fullmatch(tags.strip()):
+        return tags
+
+    # Slow path: re-check per tag to raise with the offending value
     tag_list = tags.split()
 
     for tag in tag_list:
         # Alphanumeric, underscore, hyphen only
-        if not re.match(r'^[a-zA-Z0-9_-]+$', tag):
+        if not _TAG_RE.fullmatch(tag):
             raise ValueError(
                 f"Invalid tag: {tag} "
                 f"(allowed: alphanumeric, underscore, hyphen only)"
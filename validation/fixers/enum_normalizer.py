@@ -4,8 +4,10 @@ Enum Normalizer
 Normalizes enum values to SCREAMING_SNAKE_CASE format.
 """
 
+import mmap
+import os
 import sys
-import re
+from multiprocessing import Pool
 from pathlib import Path
 
 
@@ -44,11 +46,20 @@ PRIORITY_MAPPING = {
     'urgent': 'URGENT',
 }
 
+# Intern the replacement values once so every normalized line shares the
+# same string object (cheaper equality checks, no duplicate allocations)
+STATUS_MAPPING = {k: sys.intern(v) for k, v in STATUS_MAPPING.items()}
+PRIORITY_MAPPING = {k: sys.intern(v) for k, v in PRIORITY_MAPPING.items()}
+
 
 def normalize_enum_field(content: str, field_name: str, mapping: dict[str, str]) -> str:
     """
     Normalize enum values for a specific field.
 
+    Single-pass line tokenizer: each `<indent>field: value` line is
+    parsed once with partition/strip (pure C-level string ops) and the
+    value replaced via dict lookup — no regex scans over the content.
+
     Args:
         content: File content
         field_name: Name of the field (e.g., 'status', 'priority')
@@ -57,25 +68,34 @@ def normalize_enum_field(content: str, field_name: str, mapping: dict[str, str])
     Returns:
         Content with normalized enum values
     """
-    for old_value, new_value in mapping.items():
-        # Match field: "value" or field: value
-        # Support both quoted and unquoted values
-        patterns = [
-            # With quotes
-            rf'^(\s*{field_name}:\s*["\']){re.escape(old_value)}(["\'])\s*$',
-            # Without quotes
-            rf'^(\s*{field_name}:\s+){re.escape(old_value)}(\s*)$',
-        ]
-
-        for pattern in patterns:
-            content = re.sub(
-                pattern,
-                rf'\1{new_value}\2',
-                content,
-                flags=re.MULTILINE
-            )
-
-    return content
+    lines = content.splitlines(keepends=True)
+    changed = False
+
+    for i, line in enumerate(lines):
+        key, sep, rest = line.partition(':')
+        if not sep or key.lstrip() != field_name:
+            continue
+
+        value = rest.rstrip('\r\n')
+        eol = rest[len(value):]
+        core = value.strip()
+        lead_ws = value[:len(value) - len(value.lstrip())]
+        trail_ws = value[len(lead_ws) + len(core):]
+
+        if len(core) >= 2 and core[0] in ('"', "'") and core[-1] in ('"', "'"):
+            # Quoted value (quotes kept, trailing whitespace dropped)
+            new_value = mapping.get(core[1:-1])
+            if new_value is not None:
+                lines[i] = f"{key}:{lead_ws}{core[0]}{new_value}{core[-1]}{eol}"
+                changed = True
+        elif lead_ws:
+            # Unquoted value (trailing whitespace kept)
+            new_value = mapping.get(core)
+            if new_value is not None:
+                lines[i] = f"{key}:{lead_ws}{new_value}{trail_ws}{eol}"
+                changed = True
+
+    return ''.join(lines) if changed else content
 
 
 def normalize_enums(content: str) -> tuple[str, bool]:
@@ -90,11 +110,16 @@ def normalize_enums(content: str) -> tuple[str, bool]:
     """
     original_content = content
 
+    # Fast paths: a field absent from the content cannot need normalizing,
+    # and the substring scan is far cheaper than the line walk
+
     # Normalize status values
-    content = normalize_enum_field(content, 'status', STATUS_MAPPING)
+    if 'status' in content:
+        content = normalize_enum_field(content, 'status', STATUS_MAPPING)
 
     # Normalize priority values
-    content = normalize_enum_field(content, 'priority', PRIORITY_MAPPING)
+    if 'priority' in content:
+        content = normalize_enum_field(content, 'priority', PRIORITY_MAPPING)
 
     changes_made = content != original_content
 
@@ -112,8 +137,18 @@ def process_file(file_path: Path) -> bool:
         True if changes were made, False otherwise
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return False  # Empty file, nothing to normalize
+
+            with mm:
+                # Zero-copy byte scan; files without either field skip
+                # decode and the line walk
+                if mm.find(b'status') == -1 and mm.find(b'priority') == -1:
+                    return False
+                original_content = mm[:].decode('utf-8')
 
         normalized_content, changes_made = normalize_enums(original_content)
 
@@ -137,29 +172,38 @@ def process_file(file_path: Path) -> bool:
 
 def main() -> int:
     """Main entry point."""
-    if len(sys.argv) != 2:
-        print("Usage: enum_normalizer.py <file>", file=sys.stderr)
+    if len(sys.argv) < 2:
+        print("Usage: enum_normalizer.py <file> [<file> ...]", file=sys.stderr)
         return 1
 
-    file_path = Path(sys.argv[1])
+    files = [Path(arg) for arg in sys.argv[1:]]
 
-    if not file_path.exists():
-        print(f"ERROR: File does not exist: {file_path}", file=sys.stderr)
-        return 1
+    for file_path in files:
+        if not file_path.exists():
+            print(f"ERROR: File does not exist: {file_path}", file=sys.stderr)
+            return 1
 
-    if not file_path.is_file():
-        print(f"ERROR: Not a file: {file_path}", file=sys.stderr)
-        return 1
+        if not file_path.is_file():
+            print(f"ERROR: Not a file: {file_path}", file=sys.stderr)
+            return 1
 
-    # Process the file
-    changes_made = process_file(file_path)
+    # Single file: process in-process (no pool startup cost)
+    if len(files) == 1:
+        changes_made = process_file(files[0])
 
-    if changes_made:
-        print(f"Normalized enum values in: {file_path}")
-        return 0
-    else:
-        print(f"No enum values to normalize: {file_path}")
-        return 1
+        if changes_made:
+            print(f"Normalized enum values in: {files[0]}")
+            return 0
+        else:
+            print(f"No enum values to normalize: {files[0]}")
+            return 1
+
+    # Batch mode: files are independent, parallelize across cores
+    with Pool(os.cpu_count()) as pool:
+        changed = sum(pool.imap_unordered(process_file, files, chunksize=16))
+
+    print(f"Normalized enum values in {changed} of {len(files)} files")
+    return 0 if changed else 1
 
 
 if __name__ == '__main__':
@@ -4,11 +4,23 @@ Markdown Stripper
 Extracts YAML content from markdown code blocks.
 """
 
+import mmap
+import os
 import sys
 import re
+from multiprocessing import Pool
 from pathlib import Path
 
 
+# All code block marker forms fused into one alternation: opening
+# ```yaml / ```yml, closing ```, and standalone ``` lines
+_MARKER_RE = re.compile(
+    r'(?m)^```ya?ml\s*\n|\n```\s*$|^\s*```\s*\n|^```\s*$')
+
+# Extra blank lines left behind by marker removal
+_EXTRA_BLANK_RE = re.compile(r'\n\n\n+')
+
+
 def strip_markdown_blocks(content: str) -> tuple[str, bool]:
     """
     Remove markdown code block markers from content.
@@ -19,20 +31,15 @@ def strip_markdown_blocks(content: str) -> tuple[str, bool]:
     Returns:
         Tuple of (cleaned content, whether changes were made)
     """
-    original_content = content
-
-    # Remove opening ```yaml or ```yml markers
-    content = re.sub(r'^```ya?ml\s*\n', '', content, flags=re.MULTILINE)
-
-    # Remove closing ``` markers
-    content = re.sub(r'\n```\s*$', '', content, flags=re.MULTILINE)
-    content = re.sub(r'^```\s*$', '', content, flags=re.MULTILINE)
+    # Fast path: no fence marker anywhere, nothing to strip
+    if '```' not in content:
+        return content, False
 
-    # Remove any standalone ``` on a line
-    content = re.sub(r'^\s*```\s*\n', '', content, flags=re.MULTILINE)
+    original_content = content
 
-    # Clean up extra blank lines that might result
-    content = re.sub(r'\n\n\n+', '\n\n', content)
+    # Remove all markers in one pass, then collapse extra blank lines
+    content = _MARKER_RE.sub('', content)
+    content = _EXTRA_BLANK_RE.sub('\n\n', content)
 
     changes_made = content != original_content
 
@@ -50,8 +57,17 @@ def process_file(file_path: Path) -> bool:
         True if changes were made, False otherwise
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return False  # Empty file, nothing to strip
+
+            with mm:
+                # Zero-copy byte scan; clean files skip decode and regex
+                if mm.find(b'```') == -1:
+                    return False
+                original_content = mm[:].decode('utf-8')
 
         cleaned_content, changes_made = strip_markdown_blocks(original_content)
 
@@ -75,29 +91,38 @@ def process_file(file_path: Path) -> bool:
 
 def main() -> int:
     """Main entry point."""
-    if len(sys.argv) != 2:
-        print("Usage: markdown_stripper.py <file>", file=sys.stderr)
+    if len(sys.argv) < 2:
+        print("Usage: markdown_stripper.py <file> [<file> ...]", file=sys.stderr)
         return 1
 
-    file_path = Path(sys.argv[1])
+    files = [Path(arg) for arg in sys.argv[1:]]
 
-    if not file_path.exists():
-        print(f"ERROR: File does not exist: {file_path}", file=sys.stderr)
-        return 1
+    for file_path in files:
+        if not file_path.exists():
+            print(f"ERROR: File does not exist: {file_path}", file=sys.stderr)
+            return 1
 
-    if not file_path.is_file():
-        print(f"ERROR: Not a file: {file_path}", file=sys.stderr)
-        return 1
+        if not file_path.is_file():
+            print(f"ERROR: Not a file: {file_path}", file=sys.stderr)
+            return 1
 
-    # Process the file
-    changes_made = process_file(file_path)
+    # Single file: process in-process (no pool startup cost)
+    if len(files) == 1:
+        changes_made = process_file(files[0])
 
-    if changes_made:
-        print(f"Stripped markdown blocks from: {file_path}")
-        return 0
-    else:
-        print(f"No markdown blocks found: {file_path}")
-        return 1
+        if changes_made:
+            print(f"Stripped markdown blocks from: {files[0]}")
+            return 0
+        else:
+            print(f"No markdown blocks found: {files[0]}")
+            return 1
+
+    # Batch mode: files are independent, parallelize across cores
+    with Pool(os.cpu_count()) as pool:
+        changed = sum(pool.imap_unordered(process_file, files, chunksize=16))
+
+    print(f"Stripped markdown blocks from {changed} of {len(files)} files")
+    return 0 if changed else 1
 
 
 if __name__ == '__main__':
@@ -4,13 +4,20 @@ YAML Auto-Fixer
 Fixes common YAML issues in task files.
 """
 
+import mmap
+import os
 import sys
 import re
+from multiprocessing import Pool
 from pathlib import Path
 
 
 def remove_markdown_blocks(content: str) -> str:
     """Remove markdown code blocks (```yaml, ```)."""
+    # Fast path: no fence marker anywhere, nothing to strip
+    if '```' not in content:
+        return content
+
     # Remove opening ```yaml or ```yml
     content = re.sub(r'^```ya?ml\s*\n', '', content, flags=re.MULTILINE)
     # Remove closing ```
@@ -19,42 +26,67 @@ def remove_markdown_blocks(content: str) -> str:
     return content
 
 
+# Both legacy id field names fused into one alternation so renaming
+# takes a single pass over the content
+_FIELD_RENAME_RE = re.compile(r'^(\s*)(?:sprint_id|task_id):', re.MULTILINE)
+
+
 def fix_field_names(content: str) -> str:
     """Fix field names (sprint_id: → id:, task_id: → id:)."""
-    # Fix sprint_id and task_id to id
-    content = re.sub(r'^(\s*)sprint_id:', r'\1id:', content, flags=re.MULTILINE)
-    content = re.sub(r'^(\s*)task_id:', r'\1id:', content, flags=re.MULTILINE)
-    return content
+    return _FIELD_RENAME_RE.sub(r'\1id:', content)
+
+
+# Status values (matched case-insensitively, keys lowercased once)
+STATUS_MAPPING = {
+    'done': 'DONE',
+    'pending': 'PENDING',
+    'in progress': 'IN_PROGRESS',
+    'in_progress': 'IN_PROGRESS',
+    'inprogress': 'IN_PROGRESS',
+    'blocked': 'BLOCKED',
+    'cancelled': 'CANCELLED',
+}
+
+# Intern the replacement values once so every normalized line shares the
+# same string object (cheaper equality checks, no duplicate allocations)
+STATUS_MAPPING = {k: sys.intern(v) for k, v in STATUS_MAPPING.items()}
 
 
 def normalize_enum_values(content: str) -> str:
-    """Normalize enum values to SCREAMING_SNAKE_CASE."""
-    # Status values
-    status_mapping = {
-        'Done': 'DONE',
-        'done': 'DONE',
-        'Pending': 'PENDING',
-        'pending': 'PENDING',
-        'In Progress': 'IN_PROGRESS',
-        'in progress': 'IN_PROGRESS',
-        'in_progress': 'IN_PROGRESS',
-        'InProgress': 'IN_PROGRESS',
-        'Blocked': 'BLOCKED',
-        'blocked': 'BLOCKED',
-        'Cancelled': 'CANCELLED',
-        'cancelled': 'CANCELLED',
-    }
-
-    for old_value, new_value in status_mapping.items():
-        # Match status: "value" or status: value
-        content = re.sub(
-            rf'^(\s*status:\s*["\']?){re.escape(old_value)}(["\']?\s*)$',
-            rf'\1{new_value}\2',
-            content,
-            flags=re.MULTILINE | re.IGNORECASE
-        )
+    """Normalize enum values to SCREAMING_SNAKE_CASE.
 
-    return content
+    Single-pass line tokenizer: each `status: value` line is parsed once
+    with partition/strip and the value replaced via dict lookup,
+    preserving the original quoting — no per-mapping regex scans.
+    """
+    lines = content.splitlines(keepends=True)
+    changed = False
+
+    for i, line in enumerate(lines):
+        key, sep, rest = line.partition(':')
+        if not sep or key.lstrip().lower() != 'status':
+            continue
+
+        value = rest.rstrip('\r\n')
+        eol = rest[len(value):]
+        core = value.strip()
+        lead_ws = value[:len(value) - len(value.lstrip())]
+        trail_ws = value[len(lead_ws) + len(core):]
+
+        # Optional quotes on either side (kept as-is)
+        open_quote = close_quote = ''
+        if core and core[0] in ('"', "'"):
+            open_quote, core = core[0], core[1:]
+        if core and core[-1] in ('"', "'"):
+            close_quote, core = core[-1], core[:-1]
+
+        new_value = STATUS_MAPPING.get(core.lower())
+        if new_value is not None and new_value != core:
+            lines[i] = (f"{key}:{lead_ws}{open_quote}{new_value}"
+                        f"{close_quote}{trail_ws}{eol}")
+            changed = True
+
+    return ''.join(lines) if changed else content
 
 
 def fix_yaml_file(file_path: Path) -> bool:
@@ -68,8 +100,22 @@ def fix_yaml_file(file_path: Path) -> bool:
         True if changes were made, False otherwise
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return False  # Empty file, nothing to fix
+
+            with mm:
+                # Zero-copy byte scan; files with no fixable marker skip
+                # decode and the fixer pipeline. status is matched
+                # case-insensitively, hence the lowered copy fallback.
+                if (mm.find(b'```') == -1
+                        and mm.find(b'sprint_id') == -1
+                        and mm.find(b'task_id') == -1
+                        and b'status' not in bytes(mm).lower()):
+                    return False
+                original_content = mm[:].decode('utf-8')
 
         # Apply fixes
         content = original_content
@@ -98,29 +144,38 @@ def fix_yaml_file(file_path: Path) -> bool:
 
 def main() -> int:
     """Main entry point."""
-    if len(sys.argv) != 2:
-        print("Usage: yaml_fixer.py <file.yml>", file=sys.stderr)
+    if len(sys.argv) < 2:
+        print("Usage: yaml_fixer.py <file.yml> [<file.yml> ...]", file=sys.stderr)
         return 1
 
-    file_path = Path(sys.argv[1])
+    files = [Path(arg) for arg in sys.argv[1:]]
 
-    if not file_path.exists():
-        print(f"ERROR: File does not exist: {file_path}", file=sys.stderr)
-        return 1
+    for file_path in files:
+        if not file_path.exists():
+            print(f"ERROR: File does not exist: {file_path}", file=sys.stderr)
+            return 1
 
-    if not file_path.is_file():
-        print(f"ERROR: Not a file: {file_path}", file=sys.stderr)
-        return 1
+        if not file_path.is_file():
+            print(f"ERROR: Not a file: {file_path}", file=sys.stderr)
+            return 1
 
-    # Fix the file
-    changes_made = fix_yaml_file(file_path)
+    # Single file: fix in-process (no pool startup cost)
+    if len(files) == 1:
+        changes_made = fix_yaml_file(files[0])
 
-    if changes_made:
-        print(f"Fixed: {file_path}")
-        return 0
-    else:
-        print(f"No changes needed: {file_path}")
-        return 1
+        if changes_made:
+            print(f"Fixed: {files[0]}")
+            return 0
+        else:
+            print(f"No changes needed: {files[0]}")
+            return 1
+
+    # Batch mode: files are independent, parallelize across cores
+    with Pool(os.cpu_count()) as pool:
+        changed = sum(pool.imap_unordered(fix_yaml_file, files, chunksize=16))
+
+    print(f"Fixed {changed} of {len(files)} files")
+    return 0 if changed else 1
 
 
 if __name__ == '__main__':
@@ -42,6 +42,16 @@ else
     ((failed++))
 fi
 
+# Test Agent Metadata Parser
+echo "Running test_agent_metadata_parser..."
+if "${SCRIPT_DIR}/test_agent_metadata_parser.sh" > /dev/null 2>&1; then
+    echo "  ✓ PASSED"
+    ((passed++))
+else
+    echo "  ✗ FAILED"
+    ((failed++))
+fi
+
 # Test Pipeline
 echo "Running test_pipeline..."
 if "${SCRIPT_DIR}/test_pipeline.sh" > /dev/null 2>&1; then
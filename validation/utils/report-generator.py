@@ -21,11 +21,38 @@ Security:
     - No dynamic code execution
 """
 
+import os
 import sys
 import json
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
+from types import SimpleNamespace
+
+# Optional streaming JSON parser for large reports
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional Rust JSON codec; both helpers take/produce bytes
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Reports below this size use the plain json.load fast path
+_STREAM_THRESHOLD_BYTES = 1_000_000
 
 
 class ExitCode(Enum):
@@ -35,29 +62,42 @@ class ExitCode(Enum):
     SCRIPT_ERROR = 2
 
 
-class Color:
-    """ANSI color codes for terminal output."""
-    RED = '\033[0;31m'
-    GREEN = '\033[0;32m'
-    YELLOW = '\033[1;33m'
-    BLUE = '\033[0;34m'
-    CYAN = '\033[0;36m'
-    BOLD = '\033[1m'
-    NC = '\033[0m'  # No Color
-
-    @classmethod
-    def disable(cls):
-        """Disable colors for non-interactive output."""
-        cls.RED = ''
-        cls.GREEN = ''
-        cls.YELLOW = ''
-        cls.BLUE = ''
-        cls.CYAN = ''
-        cls.BOLD = ''
-        cls.NC = ''
-
-
-@dataclass
+# Rule strings reused by every formatted section
+_DOUBLE_RULE = '═' * 60
+_SINGLE_RULE = '─' * 60
+
+
+def _make_color_profile(*, red: str, green: str, yellow: str, blue: str,
+                        cyan: str, bold: str, nc: str) -> SimpleNamespace:
+    """Build a color profile with precomputed composite tokens."""
+    return SimpleNamespace(
+        RED=red, GREEN=green, YELLOW=yellow, BLUE=blue,
+        CYAN=cyan, BOLD=bold, NC=nc,
+        DOUBLE_RULE=f"{bold}{_DOUBLE_RULE}{nc}",
+        SINGLE_RULE=f"{bold}{_SINGLE_RULE}{nc}",
+        STATUS_PASSED=f"{green}✅ PASSED{nc}",
+        STATUS_FAILED=f"{red}❌ FAILED{nc}",
+        STATUS_SKIPPED=f"{yellow}⚠️  SKIPPED{nc}",
+    )
+
+
+_COLORS_ON = _make_color_profile(
+    red='\033[0;31m', green='\033[0;32m', yellow='\033[1;33m',
+    blue='\033[0;34m', cyan='\033[0;36m', bold='\033[1m', nc='\033[0m')
+_COLORS_OFF = _make_color_profile(
+    red='', green='', yellow='', blue='', cyan='', bold='', nc='')
+
+# Active color profile; rebound once in main based on the output mode
+Color = _COLORS_ON
+
+
+def _set_color_profile(enabled: bool) -> None:
+    """Select the active color profile (replaces Color.disable mutation)."""
+    global Color
+    Color = _COLORS_ON if enabled else _COLORS_OFF
+
+
+@dataclass(slots=True)
 class GateError:
     """Represents a single validation error."""
     file_path: str
@@ -67,20 +107,22 @@ class GateError:
 
     def format(self) -> str:
         """Format error with file:line reference."""
-        location = f"{self.file_path}"
+        location = self.file_path
         if self.line is not None:
-            location += f":{self.line}"
+            location = f"{location}:{self.line}"
 
-        output = f"  {Color.RED}❌{Color.NC} {location}\n"
-        output += f"     {self.message}\n"
+        parts = [
+            f"  {Color.RED}❌{Color.NC} {location}\n",
+            f"     {self.message}\n",
+        ]
 
         if self.suggestion:
-            output += f"     {Color.CYAN}💡 {self.suggestion}{Color.NC}\n"
+            parts.append(f"     {Color.CYAN}💡 {self.suggestion}{Color.NC}\n")
 
-        return output
+        return ''.join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class GateResult:
     """Represents validation result for a single gate."""
     name: str
@@ -98,38 +140,40 @@ class GateResult:
     def format_status(self) -> str:
         """Format status with emoji and color."""
         if self.status == "passed":
-            return f"{Color.GREEN}✅ PASSED{Color.NC}"
+            return Color.STATUS_PASSED
         elif self.status == "failed":
-            return f"{Color.RED}❌ FAILED{Color.NC}"
+            return Color.STATUS_FAILED
         else:  # skipped
-            return f"{Color.YELLOW}⚠️  SKIPPED{Color.NC}"
+            return Color.STATUS_SKIPPED
 
     def format_detailed(self) -> str:
         """Format detailed gate result."""
-        output = f"\n{Color.BOLD}{'─' * 60}{Color.NC}\n"
-        output += f"{Color.BOLD}{self.name}{Color.NC} ({self.layer})\n"
-        output += f"Status: {self.format_status()}\n"
+        parts = [
+            f"\n{Color.SINGLE_RULE}\n",
+            f"{Color.BOLD}{self.name}{Color.NC} ({self.layer})\n",
+            f"Status: {self.format_status()}\n",
+        ]
 
         if self.execution_time is not None:
-            output += f"Time: {self.execution_time:.2f}s\n"
+            parts.append(f"Time: {self.execution_time:.2f}s\n")
 
         if self.auto_fixed > 0:
-            output += f"{Color.YELLOW}Auto-fixed: {self.auto_fixed} issues{Color.NC}\n"
+            parts.append(f"{Color.YELLOW}Auto-fixed: {self.auto_fixed} issues{Color.NC}\n")
 
         if self.errors:
-            output += f"\n{Color.RED}Errors ({len(self.errors)}):{Color.NC}\n"
+            parts.append(f"\n{Color.RED}Errors ({len(self.errors)}):{Color.NC}\n")
             for error in self.errors:
-                output += error.format()
+                parts.append(error.format())
 
         if self.warnings:
-            output += f"\n{Color.YELLOW}Warnings ({len(self.warnings)}):{Color.NC}\n"
+            parts.append(f"\n{Color.YELLOW}Warnings ({len(self.warnings)}):{Color.NC}\n")
             for warning in self.warnings:
-                output += f"  ⚠️  {warning}\n"
+                parts.append(f"  ⚠️  {warning}\n")
 
-        return output
+        return ''.join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationReport:
     """Complete validation report."""
     gates: List[GateResult]
@@ -146,71 +190,73 @@ class ValidationReport:
 
     def format_summary(self) -> str:
         """Format summary section."""
-        output = f"\n{Color.BOLD}{'═' * 60}{Color.NC}\n"
-        output += f"{Color.BOLD}VALIDATION REPORT SUMMARY{Color.NC}\n"
-        output += f"{Color.BOLD}{'═' * 60}{Color.NC}\n\n"
+        parts = [
+            f"\n{Color.DOUBLE_RULE}\n",
+            f"{Color.BOLD}VALIDATION REPORT SUMMARY{Color.NC}\n",
+            f"{Color.DOUBLE_RULE}\n\n",
+        ]
 
         if self.project_path:
-            output += f"Project: {self.project_path}\n"
+            parts.append(f"Project: {self.project_path}\n")
         if self.timestamp:
-            output += f"Timestamp: {self.timestamp}\n"
+            parts.append(f"Timestamp: {self.timestamp}\n")
 
-        output += f"\nTotal Gates: {self.total_gates}\n"
-        output += f"{Color.GREEN}Passed: {self.passed_gates}{Color.NC}\n"
+        parts.append(f"\nTotal Gates: {self.total_gates}\n")
+        parts.append(f"{Color.GREEN}Passed: {self.passed_gates}{Color.NC}\n")
 
         if self.failed_gates > 0:
-            output += f"{Color.RED}Failed: {self.failed_gates}{Color.NC}\n"
+            parts.append(f"{Color.RED}Failed: {self.failed_gates}{Color.NC}\n")
         else:
-            output += f"Failed: {self.failed_gates}\n"
+            parts.append(f"Failed: {self.failed_gates}\n")
 
         if self.auto_fixed_total > 0:
-            output += f"{Color.YELLOW}Auto-fixed: {self.auto_fixed_total}{Color.NC}\n"
+            parts.append(f"{Color.YELLOW}Auto-fixed: {self.auto_fixed_total}{Color.NC}\n")
 
-        output += f"\n{Color.BOLD}Overall Status: "
+        parts.append(f"\n{Color.BOLD}Overall Status: ")
         if self.is_success():
-            output += f"{Color.GREEN}✅ ALL GATES PASSED{Color.NC}{Color.BOLD}{Color.NC}\n"
+            parts.append(f"{Color.GREEN}✅ ALL GATES PASSED{Color.NC}{Color.BOLD}{Color.NC}\n")
         else:
-            output += f"{Color.RED}❌ VALIDATION FAILED{Color.NC}{Color.BOLD}{Color.NC}\n"
+            parts.append(f"{Color.RED}❌ VALIDATION FAILED{Color.NC}{Color.BOLD}{Color.NC}\n")
 
-        return output
+        return ''.join(parts)
 
     def format_text(self) -> str:
         """Format complete text report."""
-        output = self.format_summary()
+        parts = [self.format_summary()]
 
         # Per-gate results
-        output += f"\n{Color.BOLD}{'═' * 60}{Color.NC}\n"
-        output += f"{Color.BOLD}GATE RESULTS{Color.NC}\n"
-        output += f"{Color.BOLD}{'═' * 60}{Color.NC}\n"
+        parts.append(f"\n{Color.DOUBLE_RULE}\n")
+        parts.append(f"{Color.BOLD}GATE RESULTS{Color.NC}\n")
+        parts.append(f"{Color.DOUBLE_RULE}\n")
 
         for gate in self.gates:
-            output += gate.format_detailed()
+            parts.append(gate.format_detailed())
 
         # Final summary
-        output += f"\n{Color.BOLD}{'═' * 60}{Color.NC}\n"
+        parts.append(f"\n{Color.DOUBLE_RULE}\n")
 
         if self.is_success():
-            output += f"{Color.GREEN}{Color.BOLD}✅ VALIDATION SUCCESSFUL{Color.NC}\n"
+            parts.append(f"{Color.GREEN}{Color.BOLD}✅ VALIDATION SUCCESSFUL{Color.NC}\n")
         else:
-            output += f"{Color.RED}{Color.BOLD}❌ VALIDATION FAILED{Color.NC}\n"
-            output += f"\n{Color.YELLOW}Suggestions for fixes:{Color.NC}\n"
+            parts.append(f"{Color.RED}{Color.BOLD}❌ VALIDATION FAILED{Color.NC}\n")
+            parts.append(f"\n{Color.YELLOW}Suggestions for fixes:{Color.NC}\n")
 
             failed_count = 0
             for gate in self.gates:
                 if not gate.is_passed():
                     failed_count += 1
-                    output += f"\n{failed_count}. {gate.name}:\n"
+                    parts.append(f"\n{failed_count}. {gate.name}:\n")
 
                     if gate.errors:
                         for error in gate.errors:
                             if error.suggestion:
-                                output += f"   • {error.suggestion}\n"
+                                parts.append(f"   • {error.suggestion}\n")
                     else:
-                        output += f"   • Review {gate.layer} requirements\n"
+                        parts.append(f"   • Review {gate.layer} requirements\n")
 
-        output += f"{Color.BOLD}{'═' * 60}{Color.NC}\n"
+        parts.append(f"{Color.DOUBLE_RULE}\n")
 
-        return output
+        return ''.join(parts)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON output."""
@@ -247,56 +293,85 @@ class ValidationReport:
         }
 
 
-class ReportParser:
-    """Parse JSON validation reports."""
-
-    @staticmethod
-    def parse_error(error_data: Dict[str, Any]) -> GateError:
-        """Parse a single error from JSON."""
-        return GateError(
-            file_path=error_data.get("file", "unknown"),
-            line=error_data.get("line"),
-            message=error_data.get("message", "No message"),
-            suggestion=error_data.get("suggestion")
-        )
-
-    @staticmethod
-    def parse_gate(gate_data: Dict[str, Any]) -> GateResult:
-        """Parse a single gate result from JSON."""
-        errors = [
-            ReportParser.parse_error(err)
-            for err in gate_data.get("errors", [])
-        ]
-
-        return GateResult(
-            name=gate_data.get("name", "Unknown Gate"),
-            layer=gate_data.get("layer", "unknown"),
-            status=gate_data.get("status", "unknown"),
-            errors=errors,
-            warnings=gate_data.get("warnings", []),
-            auto_fixed=gate_data.get("auto_fixed", 0),
-            execution_time=gate_data.get("execution_time")
-        )
-
-    @staticmethod
-    def parse(json_data: Dict[str, Any]) -> ValidationReport:
-        """Parse complete validation report from JSON."""
-        gates = [
-            ReportParser.parse_gate(gate)
-            for gate in json_data.get("gates", [])
-        ]
-
-        summary = json_data.get("summary", {})
-
-        return ValidationReport(
-            gates=gates,
-            total_gates=summary.get("total_gates", len(gates)),
-            passed_gates=summary.get("passed", 0),
-            failed_gates=summary.get("failed", 0),
-            auto_fixed_total=summary.get("auto_fixed", 0),
-            timestamp=summary.get("timestamp"),
-            project_path=summary.get("project_path")
-        )
+def _parse_error(error_data: Dict[str, Any]) -> GateError:
+    """Parse a single error from JSON."""
+    return GateError(
+        file_path=error_data.get("file", "unknown"),
+        line=error_data.get("line"),
+        message=error_data.get("message", "No message"),
+        suggestion=error_data.get("suggestion")
+    )
+
+
+def _parse_gate(gate_data: Dict[str, Any]) -> GateResult:
+    """Parse a single gate result from JSON."""
+    # Local alias: avoids the repeated global lookup in the hot loop
+    parse_error = _parse_error
+    errors = [parse_error(err) for err in gate_data.get("errors", [])]
+
+    return GateResult(
+        name=gate_data.get("name", "Unknown Gate"),
+        layer=gate_data.get("layer", "unknown"),
+        status=gate_data.get("status", "unknown"),
+        errors=errors,
+        warnings=gate_data.get("warnings", []),
+        auto_fixed=gate_data.get("auto_fixed", 0),
+        execution_time=gate_data.get("execution_time")
+    )
+
+
+def _parse_report(json_data: Dict[str, Any]) -> ValidationReport:
+    """Parse complete validation report from JSON."""
+    parse_gate = _parse_gate
+    gates = [parse_gate(gate) for gate in json_data.get("gates", [])]
+
+    summary = json_data.get("summary", {})
+
+    return ValidationReport(
+        gates=gates,
+        total_gates=summary.get("total_gates", len(gates)),
+        passed_gates=summary.get("passed", 0),
+        failed_gates=summary.get("failed", 0),
+        auto_fixed_total=summary.get("auto_fixed", 0),
+        timestamp=summary.get("timestamp"),
+        project_path=summary.get("project_path")
+    )
+
+
+def _stream_parse_report(file_path: str) -> ValidationReport:
+    """Stream-parse a report, constructing one gate at a time.
+
+    Keeps peak memory at roughly one gate's worth instead of the whole
+    JSON tree plus its raw text.
+    """
+    with open(file_path, 'rb') as f:
+        parse_gate = _parse_gate
+        gates = [parse_gate(g) for g in ijson.items(f, 'gates.item', use_float=True)]
+        f.seek(0)
+        summary = dict(ijson.kvitems(f, 'summary', use_float=True))
+
+    return ValidationReport(
+        gates=gates,
+        total_gates=summary.get("total_gates", len(gates)),
+        passed_gates=summary.get("passed", 0),
+        failed_gates=summary.get("failed", 0),
+        auto_fixed_total=summary.get("auto_fixed", 0),
+        timestamp=summary.get("timestamp"),
+        project_path=summary.get("project_path")
+    )
+
+
+def _load_report(file_path: str) -> ValidationReport:
+    """Load a report, streaming large files when ijson is available."""
+    if ijson is not None:
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            size = 0  # Missing file: fall through for the standard error
+        if size >= _STREAM_THRESHOLD_BYTES:
+            return _stream_parse_report(file_path)
+
+    return _parse_report(read_report_file(file_path))
 
 
 def parse_args() -> tuple[str, str]:
@@ -340,8 +415,8 @@ def read_report_file(file_path: str) -> Dict[str, Any]:
         json.JSONDecodeError: If JSON is invalid
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return _json_loads(f.read())
     except FileNotFoundError:
         raise FileNotFoundError(f"Report file not found: {file_path}")
     except json.JSONDecodeError as e:
@@ -364,16 +439,14 @@ def main() -> int:
         report_path, output_format = parse_args()
 
         # Disable colors if not outputting to terminal or if JSON format
-        if not sys.stdout.isatty() or output_format == "json":
-            Color.disable()
+        _set_color_profile(sys.stdout.isatty() and output_format != "json")
 
-        # Read and parse report
-        json_data = read_report_file(report_path)
-        report = ReportParser.parse(json_data)
+        # Read and parse report (streamed when large)
+        report = _load_report(report_path)
 
-        # Generate output
+        # Generate output (JSON is emitted as bytes, no intermediate str)
         if output_format == "json":
-            print(json.dumps(report.to_dict(), indent=2))
+            sys.stdout.buffer.write(_json_dumps(report.to_dict()) + b"\n")
         else:  # text
             print(report.format_text())
 